@@ -14,22 +14,65 @@ Notes:
 
 import time
 import os
+
+# The capture/inference/display stages already keep several cores busy; letting OpenCV's and
+# OpenMP's own thread pools fan out on top of that oversubscribes the CPU and slows MediaPipe.
+# Must be set before cv2/mediapipe are imported. Trade-off: individual OpenCV calls
+# (resize, cvtColor) no longer parallelize internally, which is fine at inference resolution.
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
+import functools
+import queue
 import threading
 import boto3
+from botocore.config import Config
 import cv2
 import mediapipe as mp
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python/NumPy
+    def njit(*args, **kwargs):
+        return lambda fn: fn
+
 # ---------------------------
 # Configuration
 # ---------------------------
 
 DEBOUNCE_FRAMES = 8        # gesture must persist for this many frames to trigger
 COOLDOWN_SECONDS = 4       # seconds to wait after triggering before accepting new gestures
-
-# AWS clients (will use default session/credentials resolution)
-ec2 = boto3.client("ec2")
-s3 = boto3.client("s3")
+INFERENCE_SIZE = (320, 240)  # (width, height) frame fed to MediaPipe; display stays full-res
+DISPLAY_EVERY_N = 2        # draw + imshow only every Nth processed frame (inference still runs on all)
+QUEUE_TIMEOUT = 0.1        # seconds a pipeline stage waits on its queue before re-checking for shutdown
+
+# Path to a MediaPipe hand_landmarker.task model. When set, inference runs on the GPU
+# through the Tasks API (LIVE_STREAM mode); otherwise the CPU solutions API is used.
+HAND_LANDMARKER_MODEL = os.environ.get("HAND_LANDMARKER_MODEL")
+
+# Shared client config: keep-alive pooled connections so repeated AWS calls skip the TCP/TLS handshake
+_cfg = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=15,
+    retries={"max_attempts": 3, "mode": "standard"},
+)
+
+# AWS clients (will use default session/credentials resolution).
+# Created lazily on first use so startup doesn't pay for credential lookup / service models.
+_clients = {}
+
+def _client(service):
+    if service not in _clients:
+        _clients[service] = boto3.client(service, config=_cfg)
+    return _clients[service]
+
+def _ec2():
+    return _client("ec2")
+
+def _s3():
+    return _client("s3")
 
 # ---------------------------
 # MediaPipe helper functions
@@ -38,6 +81,33 @@ s3 = boto3.client("s3")
 mp_hands = mp.solutions.hands
 mp_drawing = mp.solutions.drawing_utils
 
+# landmark indices: https://google.github.io/mediapipe/solutions/hands
+# TIPs: 4 (thumb), 8 (index), 12 (middle), 16 (ring), 20 (pinky)
+# PIPs: 3 (thumb ip), 6 (index pip), 10 (middle pip), 14 (ring pip), 18 (pinky pip)
+_TIPS = np.array([4, 8, 12, 16, 20])
+_PIPS = np.array([3, 6, 10, 14, 18])
+# Thumb is extended when thumb_sign * (tip.x - ip.x) < 0. Frames are un-mirrored camera
+# images, so for a right hand the extended thumb tip lies at larger x than the IP joint.
+_THUMB_SIGN = {"Right": -1.0, "Left": 1.0}
+
+@njit(cache=True)
+def _classify(tips_xy, pips_xy, thumb_sign):
+    """
+    Numeric core of count_fingers (JIT-compiled when numba is available).
+    tips_xy / pips_xy: (5, 2) float32 arrays ordered thumb, index, middle, ring, pinky.
+    """
+    # Fingers: tip.y < pip.y when extended (normalized coords where 0 is top),
+    # evaluated for all five digits in one vectorized comparison
+    extended = tips_xy[:, 1] < pips_xy[:, 1]
+
+    # Thumb logic (horizontal comparison, direction set by handedness) overrides slot 0
+    extended[0] = thumb_sign * (tips_xy[0, 0] - pips_xy[0, 0]) < 0
+
+    return extended.sum()
+
+# Compile once at import so the JIT cost doesn't land on the first webcam frame
+_classify(np.zeros((5, 2), dtype=np.float32), np.zeros((5, 2), dtype=np.float32), 1.0)
+
 def count_fingers(hand_landmarks, hand_label):
     """
     Count raised fingers for a single hand using landmark positions.
@@ -47,39 +117,13 @@ def count_fingers(hand_landmarks, hand_label):
     - Thumb: compare TIP and IP x-coordinates (depends on left/right hand)
     - Fingers (index, middle, ring, pinky): compare TIP y < PIP y (tip above pip => extended)
     """
-    # landmark indices: https://google.github.io/mediapipe/solutions/hands
-    # TIPs: 4 (thumb), 8 (index), 12 (middle), 16 (ring), 20 (pinky)
-    # PIPs: 3 (thumb ip), 6 (index pip), 10 (middle pip), 14 (ring pip), 18 (pinky pip)
-    tips_ids = [4, 8, 12, 16, 20]
-    pip_ids = [3, 6, 10, 14, 18]
-
-    img_handed = hand_landmarks.landmark  # list of normalized landmarks
-
-    fingers = []
+    # Pack all 21 normalized (x, y) landmarks into one array; the comparisons run in _classify
+    lm = np.fromiter((c for p in hand_landmarks.landmark for c in (p.x, p.y)),
+                     dtype=np.float32, count=42).reshape(21, 2)
+    tips = lm[_TIPS]
+    pips = lm[_PIPS]
 
-    # Thumb logic (horizontal comparison)
-    # For right hand, thumb tip.x < ip.x when extended (may vary by camera/mirror)
-    # We'll use hand_label to decide direction
-    try:
-        thumb_tip = img_handed[tips_ids[0]]
-        thumb_ip = img_handed[pip_ids[0]]
-        if hand_label == "Right":
-            fingers.append(1 if thumb_tip.x < thumb_ip.x else 0)
-        else:  # Left
-            fingers.append(1 if thumb_tip.x > thumb_ip.x else 0)
-    except Exception:
-        fingers.append(0)
-
-    # Other four fingers: tip.y < pip.y when extended (normalized coords where 0 is top)
-    for tid, pid in zip(tips_ids[1:], pip_ids[1:]):
-        try:
-            tip = img_handed[tid]
-            pip = img_handed[pid]
-            fingers.append(1 if tip.y < pip.y else 0)
-        except Exception:
-            fingers.append(0)
-
-    return sum(fingers)
+    return int(_classify(tips, pips, _THUMB_SIGN.get(hand_label, 1.0)))
 
 # ---------------------------
 # AWS operation wrappers (safe - require confirmation)
@@ -87,19 +131,18 @@ def count_fingers(hand_landmarks, hand_label):
 
 def list_ec2_instances():
     """List EC2 instances (ID, state, type, name)"""
-    resp = ec2.describe_instances()
+    paginator = _ec2().get_paginator("describe_instances")
+    pages = paginator.paginate(PaginationConfig={"PageSize": 100})
     instances = []
-    for res in resp.get("Reservations", []):
-        for inst in res.get("Instances", []):
-            iid = inst.get("InstanceId")
-            state = inst.get("State", {}).get("Name")
-            itype = inst.get("InstanceType")
-            # Find Name tag if present
-            name = None
-            for tag in inst.get("Tags", []) if inst.get("Tags") else []:
-                if tag.get("Key") == "Name":
-                    name = tag.get("Value")
-            instances.append({"InstanceId": iid, "State": state, "Type": itype, "Name": name})
+    for page in pages:
+        for res in page.get("Reservations", []):
+            for inst in res.get("Instances", []):
+                iid = inst.get("InstanceId")
+                state = inst.get("State", {}).get("Name")
+                itype = inst.get("InstanceType")
+                # Find Name tag if present
+                name = next((t.get("Value") for t in inst.get("Tags") or [] if t.get("Key") == "Name"), None)
+                instances.append({"InstanceId": iid, "State": state, "Type": itype, "Name": name})
     print("\n[EC2 Instances]")
     for i in instances:
         print(f"- {i['InstanceId']} | state={i['State']} | type={i['Type']} | name={i['Name']}")
@@ -109,7 +152,7 @@ def start_ec2_instance(instance_id):
     print(f"About to start EC2 instance: {instance_id}")
     confirm = input("Type 'yes' to confirm START: ").strip().lower()
     if confirm == "yes":
-        resp = ec2.start_instances(InstanceIds=[instance_id])
+        resp = _ec2().start_instances(InstanceIds=[instance_id])
         print("Start request sent. Result:", resp)
     else:
         print("Start cancelled.")
@@ -118,13 +161,13 @@ def stop_ec2_instance(instance_id):
     print(f"About to stop EC2 instance: {instance_id}")
     confirm = input("Type 'yes' to confirm STOP: ").strip().lower()
     if confirm == "yes":
-        resp = ec2.stop_instances(InstanceIds=[instance_id])
+        resp = _ec2().stop_instances(InstanceIds=[instance_id])
         print("Stop request sent. Result:", resp)
     else:
         print("Stop cancelled.")
 
 def list_s3_buckets():
-    resp = s3.list_buckets()
+    resp = _s3().list_buckets()
     print("\n[S3 Buckets]")
     for b in resp.get("Buckets", []):
         print(f"- {b.get('Name')}")
@@ -138,9 +181,9 @@ def create_s3_bucket(bucket_name, region=None):
         return
     try:
         if region is None:
-            resp = s3.create_bucket(Bucket=bucket_name)
+            resp = _s3().create_bucket(Bucket=bucket_name)
         else:
-            resp = s3.create_bucket(
+            resp = _s3().create_bucket(
                 Bucket=bucket_name,
                 CreateBucketConfiguration={"LocationConstraint": region}
             )
@@ -152,52 +195,304 @@ def create_s3_bucket(bucket_name, region=None):
 # Gesture → action dispatcher
 # ---------------------------
 
-last_trigger_time = 0
+def cooldown(seconds):
+    """
+    Decorator: drop calls made within `seconds` of the last accepted call.
+    The last trigger time lives in the closure instead of a module global.
+    """
+    def decorator(fn):
+        last_trigger_time = None
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            nonlocal last_trigger_time
+            # monotonic: immune to wall-clock/NTP jumps (its epoch is arbitrary, hence the None start)
+            now = time.monotonic()
+            if last_trigger_time is not None and now - last_trigger_time < seconds:
+                # in cooldown
+                return None
+            last_trigger_time = now
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def _start_prompt():
+    # Start an EC2 instance (dangerous) - ask instance id & confirm
+    iid = input("Enter EC2 InstanceId to START (or blank to cancel): ").strip()
+    if iid:
+        start_ec2_instance(iid)
+    else:
+        print("Start operation cancelled by user.")
 
+def _stop_prompt():
+    # Stop an EC2 instance
+    iid = input("Enter EC2 InstanceId to STOP (or blank to cancel): ").strip()
+    if iid:
+        stop_ec2_instance(iid)
+    else:
+        print("Stop operation cancelled by user.")
+
+def _create_prompt():
+    bucket = input("Enter new S3 bucket name (DNS-compliant) or blank to cancel: ").strip()
+    if bucket:
+        # region detection
+        region = boto3.session.Session().region_name
+        create_s3_bucket(bucket, region=region)
+    else:
+        print("Bucket creation cancelled by user.")
+
+# Finger count -> action; 0 or other counts have no action
+_HANDLERS = {
+    1: list_ec2_instances,   # safe read-only
+    2: _start_prompt,
+    3: _stop_prompt,
+    4: list_s3_buckets,
+    5: _create_prompt,
+}
+
+@cooldown(COOLDOWN_SECONDS)
 def handle_gesture(count):
     """
     Map finger count to AWS action.
-    This function runs in main thread (called after debounced detection).
+    This function runs in a daemon thread started by GestureDebouncer (one at a time).
+    """
+    print(f"\n[Gesture detected] Finger count = {count}")
+    fn = _HANDLERS.get(count)
+    if fn:
+        fn()
+
+# ---------------------------
+# Pipeline stages: capture -> inference -> display
+# ---------------------------
+
+def run_stage(stage, *args, stop_event):
+    """
+    Thread target for a pipeline stage: whether the stage returns or raises,
+    set stop_event so the other stages (and the display loop) shut down too.
+    """
+    try:
+        stage(*args, stop_event)
+    finally:
+        stop_event.set()
+
+def capture_frames(cap, frame_q, stop_event):
+    """
+    Reader stage: grab frames from the webcam and hand them to the worker.
+    Frames are passed on un-mirrored; the display stage flips only what it shows.
+    Runs in its own thread so camera I/O overlaps with inference.
+
+    Drop policy: every frame is grabbed (keeping the camera buffer drained), but it is
+    only decoded with retrieve() when frame_q's single slot is free. Frames grabbed while
+    the worker still has one waiting are intentionally discarded without decoding, so the
+    worker always receives the frame decoded right after it took the previous one.
+    """
+    while not stop_event.is_set():
+        if not cap.grab():
+            print("Failed to grab frame.")
+            stop_event.set()
+            break
+
+        if frame_q.full():
+            continue  # worker busy - drop this frame without paying for the decode
+
+        ret, frame = cap.retrieve()
+        if not ret:
+            continue
+
+        try:
+            frame_q.put_nowait(frame)
+        except queue.Full:
+            pass  # only the reader puts, so this can't happen after the full() check
+
+_PHYSICAL_HAND = {"Left": "Right", "Right": "Left"}
+
+class GestureDebouncer:
+    """
+    Debounce logic: require same count for N consecutive frames before
+    dispatching handle_gesture.
+    """
+
+    def __init__(self):
+        self.stable_count = 0
+        self.last_count = None
+        self.handler_thread = None  # at most one handler (and one stdin prompt) at a time
+
+    def update(self, finger_count):
+        # branchless: the streak survives only while the count is unchanged
+        eq = finger_count == self.last_count
+        self.stable_count = self.stable_count * eq + 1
+        self.last_count = finger_count
+
+        if self.stable_count >= DEBOUNCE_FRAMES and finger_count != 0:
+            # trigger in a daemon thread so the pipeline doesn't block on user input (and quitting
+            # doesn't wait on an unanswered prompt); gestures made while a handler is still
+            # running (e.g. waiting on input()) are ignored
+            if self.handler_thread is None or not self.handler_thread.is_alive():
+                self.handler_thread = threading.Thread(target=handle_gesture, args=(finger_count,), daemon=True)
+                self.handler_thread.start()
+            self.stable_count = 0  # reset until next gesture
+
+def publish_result(frame, hand_landmarks, hand_label, debouncer, display_q, stop_event):
+    """
+    Count fingers for the detected hand (if any), feed the debouncer and push
+    (frame, hand_landmarks, finger_count, label) to the display stage.
+    """
+    finger_count = 0
+    label = ""
+    if hand_landmarks is not None:
+        # MediaPipe reports handedness assuming a mirrored (selfie) image; frames
+        # aren't flipped anymore, so swap to get the user's actual hand
+        hand_label = _PHYSICAL_HAND.get(hand_label, hand_label)
+        finger_count = count_fingers(hand_landmarks, hand_label)
+        label = f"{hand_label} hand - {finger_count} fingers"
+
+    debouncer.update(finger_count)
+
+    while not stop_event.is_set():
+        try:
+            display_q.put((frame, hand_landmarks, finger_count, label), timeout=QUEUE_TIMEOUT)
+            break
+        except queue.Full:
+            continue
+
+def process_frames(frame_q, display_q, stop_event):
+    """
+    Worker stage (CPU, legacy solutions API): run MediaPipe Hands on each frame,
+    count fingers and debounce gestures.
+    """
+    debouncer = GestureDebouncer()
+
+    # Inference-size buffers reused every frame instead of allocating fresh arrays
+    width, height = INFERENCE_SIZE
+    small_buf = np.empty((height, width, 3), dtype=np.uint8)
+    rgb_buf = np.empty_like(small_buf)
+
+    # Higher detection / lower tracking confidence keeps MediaPipe reusing the
+    # previous frame's hand ROI instead of re-running the palm detector.
+    # model_complexity=0 selects the lite landmark model: several times faster on CPU,
+    # at the cost of slightly noisier landmarks. Finger counting only compares tip vs.
+    # joint positions, so that jitter rarely flips a count (and debouncing absorbs it).
+    with mp_hands.Hands(
+        static_image_mode=False,
+        max_num_hands=1,
+        model_complexity=0,
+        min_detection_confidence=0.7,
+        min_tracking_confidence=0.3
+    ) as hands:
+        # Warm up on a black frame so model load / graph init doesn't stall the first real frame
+        try:
+            hands.process(np.zeros((height, width, 3), dtype=np.uint8))
+        except Exception as e:
+            print("MediaPipe warm-up failed:", e)
+
+        while not stop_event.is_set():
+            try:
+                frame = frame_q.get(timeout=QUEUE_TIMEOUT)
+            except queue.Empty:
+                continue
+
+            # Run inference on a downscaled copy; landmarks are normalized (0..1),
+            # so they map straight back onto the full-resolution frame for drawing.
+            cv2.resize(frame, INFERENCE_SIZE, dst=small_buf, interpolation=cv2.INTER_LINEAR)
+            rgb_buf.flags.writeable = True
+            cv2.cvtColor(small_buf, cv2.COLOR_BGR2RGB, dst=rgb_buf)
+            # Read-only input lets MediaPipe skip its defensive copy
+            rgb_buf.flags.writeable = False
+            results = hands.process(rgb_buf)
+
+            hand_landmarks = None
+            hand_label = ""
+            if results.multi_hand_landmarks:
+                # We'll take the first hand
+                hand_landmarks = results.multi_hand_landmarks[0]
+                hand_label = results.multi_handedness[0].classification[0].label  # 'Left' or 'Right'
+
+            publish_result(frame, hand_landmarks, hand_label, debouncer, display_q, stop_event)
+
+def process_frames_gpu(frame_q, display_q, stop_event):
+    """
+    Worker stage (GPU, Tasks API): feed frames to a HandLandmarker running in
+    LIVE_STREAM mode; results arrive asynchronously in on_result.
+    Used when HAND_LANDMARKER_MODEL points at a hand_landmarker.task file.
     """
-    global last_trigger_time
-    now = time.time()
-    if now - last_trigger_time < COOLDOWN_SECONDS:
-        # in cooldown
+    debouncer = GestureDebouncer()
+    pending = {}  # timestamp_ms -> full-res frame awaiting its result
+    pending_lock = threading.Lock()
+
+    def on_result(result, image, timestamp_ms):
+        # Runs on MediaPipe's own thread, outside run_stage: a failure here must stop the
+        # pipeline explicitly or the display loop would wait forever
+        try:
+            # LIVE_STREAM may skip frames under load; forget anything older than this result
+            with pending_lock:
+                frame = pending.pop(timestamp_ms, None)
+                for ts in [ts for ts in pending if ts < timestamp_ms]:
+                    del pending[ts]
+            if frame is None:
+                return
+
+            hand_landmarks = None
+            hand_label = ""
+            if result.hand_landmarks:
+                # Convert to the solutions proto so count_fingers / draw_landmarks work unchanged
+                hand_landmarks = landmark_pb2.NormalizedLandmarkList()
+                hand_landmarks.landmark.extend(
+                    landmark_pb2.NormalizedLandmark(x=lm.x, y=lm.y, z=lm.z) for lm in result.hand_landmarks[0]
+                )
+                hand_label = result.handedness[0][0].category_name  # 'Left' or 'Right'
+
+            publish_result(frame, hand_landmarks, hand_label, debouncer, display_q, stop_event)
+        except Exception as e:
+            print("Error handling hand landmarker result:", e)
+            stop_event.set()
+
+    # A missing Tasks package, a bad model path or an unsupported GPU delegate (common on
+    # Windows / headless Linux) fails here; fall back to the CPU worker instead of leaving
+    # the pipeline without one. Imported lazily so the default CPU path never pays for them.
+    try:
+        from mediapipe.framework.formats import landmark_pb2
+        from mediapipe.tasks import python as mp_tasks
+        from mediapipe.tasks.python import vision as mp_vision
+
+        options = mp_vision.HandLandmarkerOptions(
+            base_options=mp_tasks.BaseOptions(
+                model_asset_path=HAND_LANDMARKER_MODEL,
+                delegate=mp_tasks.BaseOptions.Delegate.GPU,
+            ),
+            running_mode=mp_vision.RunningMode.LIVE_STREAM,
+            num_hands=1,
+            min_hand_detection_confidence=0.7,
+            min_tracking_confidence=0.3,
+            result_callback=on_result,
+        )
+        landmarker = mp_vision.HandLandmarker.create_from_options(options)
+    except Exception as e:
+        print("GPU hand landmarker unavailable, falling back to CPU:", e)
+        process_frames(frame_q, display_q, stop_event)
         return
-    last_trigger_time = now
 
-    print(f"\n[Gesture detected] Finger count = {count}")
-    if count == 1:
-        # List EC2 instances (safe read-only)
-        list_ec2_instances()
-    elif count == 2:
-        # Start an EC2 instance (dangerous) - ask instance id & confirm
-        iid = input("Enter EC2 InstanceId to START (or blank to cancel): ").strip()
-        if iid:
-            start_ec2_instance(iid)
-        else:
-            print("Start operation cancelled by user.")
-    elif count == 3:
-        # Stop an EC2 instance
-        iid = input("Enter EC2 InstanceId to STOP (or blank to cancel): ").strip()
-        if iid:
-            stop_ec2_instance(iid)
-        else:
-            print("Stop operation cancelled by user.")
-    elif count == 4:
-        list_s3_buckets()
-    elif count == 5:
-        bucket = input("Enter new S3 bucket name (DNS-compliant) or blank to cancel: ").strip()
-        if bucket:
-            # region detection
-            region = boto3.session.Session().region_name
-            create_s3_bucket(bucket, region=region)
-        else:
-            print("Bucket creation cancelled by user.")
-    else:
-        # 0 or other: no action
-        # You can log or show indicator
-        pass
+    width, height = INFERENCE_SIZE
+    small_buf = np.empty((height, width, 3), dtype=np.uint8)
+    rgb_buf = np.empty_like(small_buf)
+    last_ts = -1
+
+    with landmarker:
+        while not stop_event.is_set():
+            try:
+                frame = frame_q.get(timeout=QUEUE_TIMEOUT)
+            except queue.Empty:
+                continue
+
+            cv2.resize(frame, INFERENCE_SIZE, dst=small_buf, interpolation=cv2.INTER_LINEAR)
+            cv2.cvtColor(small_buf, cv2.COLOR_BGR2RGB, dst=rgb_buf)
+
+            # detect_async requires strictly increasing timestamps
+            ts = max(int(time.monotonic() * 1000), last_ts + 1)
+            last_ts = ts
+            with pending_lock:
+                pending[ts] = frame
+            # mp.Image copies the pixels, so rgb_buf can be reused for the next frame
+            landmarker.detect_async(mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_buf), ts)
 
 # ---------------------------
 # Main loop: webcam + mediapipe
@@ -209,44 +504,48 @@ def main():
     print("Mapping: 1=list EC2 | 2=start EC2 | 3=stop EC2 | 4=list S3 | 5=create S3")
     print("Hold gesture steady for a moment to trigger. Press 'q' to quit.")
 
+    # Pipeline threads provide the parallelism; keep OpenCV's pool out of MediaPipe's way
+    cv2.setNumThreads(1)
+
     cap = cv2.VideoCapture(0)
     if not cap.isOpened():
         print("ERROR: Cannot open webcam.")
         return
+    # Keep only the newest frame in the driver buffer so reads never return stale images
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    # frame_q: single slot; the reader skips decoding while it is occupied (see capture_frames)
+    # display_q: bounded, so a slow display back-pressures the worker instead of piling up frames
+    frame_q = queue.Queue(maxsize=1)
+    display_q = queue.Queue(maxsize=2)
+    stop_event = threading.Event()
+
+    # GPU Tasks API when a model file is configured, otherwise the CPU solutions API
+    process = process_frames_gpu if HAND_LANDMARKER_MODEL else process_frames
+    reader = threading.Thread(target=run_stage, args=(capture_frames, cap, frame_q),
+                              kwargs={"stop_event": stop_event}, daemon=True)
+    worker = threading.Thread(target=run_stage, args=(process, frame_q, display_q),
+                              kwargs={"stop_event": stop_event}, daemon=True)
+    reader.start()
+    worker.start()
+
+    frame_count = 0
 
-    with mp_hands.Hands(
-        static_image_mode=False,
-        max_num_hands=1,
-        min_detection_confidence=0.6,
-        min_tracking_confidence=0.5
-    ) as hands:
-        frame_count = 0
-        stable_count = 0
-        last_count = None
-
-        try:
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    print("Failed to grab frame.")
-                    break
-
-                # Flip for mirror effect if you prefer
-                frame = cv2.flip(frame, 1)
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                results = hands.process(frame_rgb)
-
-                finger_count = 0
-                label = ""
-                if results.multi_hand_landmarks:
-                    # We'll take the first hand
-                    for hand_landmarks, handedness in zip(results.multi_hand_landmarks, results.multi_handedness):
-                        hand_label = handedness.classification[0].label  # 'Left' or 'Right'
-                        finger_count = count_fingers(hand_landmarks, hand_label)
-                        # draw
-                        mp_drawing.draw_landmarks(frame, hand_landmarks, mp_hands.HAND_CONNECTIONS)
-                        label = f"{hand_label} hand - {finger_count} fingers"
-                        break
+    try:
+        # Display stage stays on the main thread (HighGUI windows must be driven from it)
+        while not stop_event.is_set():
+            try:
+                frame, landmarks, finger_count, label = display_q.get(timeout=QUEUE_TIMEOUT)
+            except queue.Empty:
+                continue
+            frame_count += 1
+
+            if frame_count % DISPLAY_EVERY_N == 0:
+                if landmarks is not None:
+                    mp_drawing.draw_landmarks(frame, landmarks, mp_hands.HAND_CONNECTIONS)
+                # Mirror effect applied once to the annotated frame (in place), and only
+                # for frames actually shown; text is drawn afterwards so it stays readable
+                cv2.flip(frame, 1, dst=frame)
 
                 # DISPLAY text on frame
                 cv2.putText(frame, f"Fingers: {finger_count}", (10, 30),
@@ -257,30 +556,23 @@ def main():
 
                 cv2.imshow("Gesture AWS Operator - press 'q' to quit", frame)
 
-                # Debounce logic: require same count for N consecutive frames
-                if finger_count == last_count:
-                    stable_count += 1
-                else:
-                    stable_count = 1
-                last_count = finger_count
-
-                if stable_count >= DEBOUNCE_FRAMES and finger_count != 0:
-                    # trigger in a separate thread so UI (camera display) doesn't block on user input
-                    t = threading.Thread(target=handle_gesture, args=(finger_count,), daemon=True)
-                    t.start()
-                    stable_count = 0  # reset until next gesture
-
-                key = cv2.waitKey(1) & 0xFF
-                if key == ord('q'):
-                    print("Quitting.")
-                    break
-
-        except KeyboardInterrupt:
-            print("Interrupted by user.")
-
-        finally:
-            cap.release()
-            cv2.destroyAllWindows()
+            # Pump the GUI every frame so the window stays responsive
+            key = cv2.waitKey(1) & 0xFF
+            if key == ord('q'):
+                print("Quitting.")
+                break
+
+    except KeyboardInterrupt:
+        print("Interrupted by user.")
+
+    finally:
+        stop_event.set()
+        # Bounded joins: a stage stuck in a native call (e.g. grab() on a stalled camera)
+        # must not hang shutdown; both threads are daemons and die with the process
+        reader.join(timeout=1.0)
+        worker.join(timeout=1.0)
+        cap.release()
+        cv2.destroyAllWindows()
 
 if __name__ == "__main__":
     main()